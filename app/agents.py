@@ -1,9 +1,10 @@
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
+from .config import settings
 from .tools import (
     extract_resume_structured,
     extract_jd_structured,
-    compute_scores,
+    compute_scores_with_inputs,
     generate_assessment,
     mask_pii,
     save_assessment_to_db,
@@ -28,6 +29,8 @@ class ResumeParserAgent(BaseAgent):
         )
 
     def run(self, resume_text: str) -> Dict[str, Any]:
+        if settings.mask_pii_before_llm:
+            resume_text = mask_pii(resume_text)  # keep contact details out of the LLM request
         return extract_resume_structured(resume_text)
 
 
@@ -49,8 +52,10 @@ class ScoringAgent(BaseAgent):
             description="Computes objective scores based on resume/JD alignment.",
         )
 
-    def run(self, resume_struct: Dict[str, Any], jd_struct: Dict[str, Any]) -> Dict[str, float]:
-        return compute_scores(resume_struct, jd_struct)
+    def run(
+        self, resume_struct: Dict[str, Any], jd_struct: Dict[str, Any]
+    ) -> Tuple[Dict[str, float], Dict[str, Any]]:
+        return compute_scores_with_inputs(resume_struct, jd_struct)
 
 
 class ReviewerAgent(BaseAgent):
@@ -77,9 +82,10 @@ class SafetyAgent(BaseAgent):
         jd_struct: Dict[str, Any],
         scores: Dict[str, float],
         assessment_text: str,
+        score_inputs: Dict[str, Any] | None = None,
     ) -> str:
         cleaned = mask_pii(assessment_text)
-        save_assessment_to_db(resume_struct, jd_struct, scores, cleaned)
+        save_assessment_to_db(resume_struct, jd_struct, scores, cleaned, score_inputs)
         return cleaned
 
 
@@ -0,0 +1,163 @@
+import os
+import json
+import atexit
+import time
+import sqlite3
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from .config import settings
+
+
+def make_key(*parts: Any) -> str:
+    """Stable sha256 of JSON-serializable parts; the cache key for LLM calls and the content hash for stored JSON."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class NullCache:
+    """No-op backend (CACHE_BACKEND=none)."""
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": 0, "hits": 0, "misses": 0}
+
+
+class SQLiteCache:
+    """Process-external JSON cache shared by every worker on the host.
+
+    Local stand-in for Redis/memcached: a WAL-mode SQLite file allows concurrent
+    readers across processes. Reads never write: hit/miss counts are kept per
+    process and flushed into a shared stats row every `flush_every` lookups, so
+    the reported hit rate is global. Entries expire after `ttl_seconds`, and the
+    table is pruned to the newest `max_entries` every `prune_every` writes.
+    Connections are opened per process and thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int = 0,
+        max_entries: int = 0,
+        flush_every: int = 100,
+        prune_every: int = 100,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.flush_every = max(1, flush_every)
+        self.prune_every = max(1, prune_every)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._writes = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        atexit.register(self.flush_stats)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_created_at ON cache (created_at)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_stats (id INTEGER PRIMARY KEY CHECK (id = 1), "
+                "hits INTEGER NOT NULL DEFAULT 0, misses INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("INSERT OR IGNORE INTO cache_stats (id, hits, misses) VALUES (1, 0, 0)")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+            due = self._hits + self._misses >= self.flush_every
+        if due:
+            self.flush_stats()
+
+    def flush_stats(self) -> None:
+        """Adds this process's pending hit/miss counts to the shared stats row (one write)."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            self._hits = self._misses = 0
+        if not hits and not misses:
+            return
+        try:
+            self._conn().execute(
+                "UPDATE cache_stats SET hits = hits + ?, misses = misses + ? WHERE id = 1", (hits, misses)
+            )
+        except sqlite3.Error as e:
+            print(f"Cache error: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            row = self._conn().execute("SELECT value, created_at FROM cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Cache error: {e}")
+            return None
+        # Expired rows read as misses; they are deleted by the next prune, not here, to keep reads lock-free
+        if row is None or (self.ttl_seconds and row[1] < time.time() - self.ttl_seconds):
+            self._record(hit=False)
+            return None
+        self._record(hit=True)
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+            with self._lock:
+                self._writes += 1
+                due = self._writes % self.prune_every == 0
+            if due:
+                self.prune()
+        except sqlite3.Error as e:
+            print(f"Cache error: {e}")
+
+    def prune(self) -> None:
+        """Deletes expired entries and, past max_entries, the oldest ones."""
+        conn = self._conn()
+        if self.ttl_seconds:
+            conn.execute("DELETE FROM cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        if self.max_entries:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def stats(self) -> Dict[str, int]:
+        self.flush_stats()
+        conn = self._conn()
+        entries = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        hits, misses = conn.execute("SELECT hits, misses FROM cache_stats WHERE id = 1").fetchone()
+        return {"entries": entries, "hits": hits, "misses": misses}
+
+
+@lru_cache(maxsize=1)
+def get_cache():
+    if settings.cache_backend == "sqlite":
+        return SQLiteCache(
+            settings.cache_path,
+            ttl_seconds=settings.cache_ttl_seconds,
+            max_entries=settings.cache_max_entries,
+        )
+    return NullCache()
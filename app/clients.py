@@ -0,0 +1,25 @@
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+from .config import settings
+
+
+@lru_cache(maxsize=1)
+def get_openai_client():
+    """Shared OpenAI client, created on first use so importing the app stays cheap."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=settings.openai_api_key)
+
+
+@lru_cache(maxsize=1)
+def _llm_semaphore() -> threading.BoundedSemaphore:
+    return threading.BoundedSemaphore(max(1, settings.llm_concurrency))
+
+
+@contextmanager
+def llm_slot():
+    """Caps in-flight OpenAI requests per worker process at LLM_CONCURRENCY."""
+    with _llm_semaphore():
+        yield
@@ -9,6 +9,17 @@ class Settings(BaseSettings):
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     db_url: str = "sqlite:///./assessments.db"
     embedding_model: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    scoring_profiles_path: str = os.getenv("SCORING_PROFILES_PATH", "data/scoring_profiles.json")
+    max_upload_bytes: int = int(os.getenv("MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+    mask_pii_before_llm: bool = os.getenv("MASK_PII_BEFORE_LLM", "false").lower() in ("1", "true", "yes")
+    workers: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    llm_concurrency: int = int(os.getenv("LLM_CONCURRENCY", "4"))
+    cache_backend: str = os.getenv("CACHE_BACKEND", "sqlite")  # "sqlite" or "none"
+    cache_path: str = os.getenv("CACHE_PATH", ".cache/llm_cache.sqlite")
+    cache_ttl_seconds: int = int(os.getenv("CACHE_TTL_SECONDS", str(7 * 24 * 3600)))  # 0 = never expire
+    cache_max_entries: int = int(os.getenv("CACHE_MAX_ENTRIES", "100000"))  # 0 = unbounded
+    rag_index_dir: str = os.getenv("RAG_INDEX_DIR", ".cache/rag_index")
+    warmup_on_startup: bool = os.getenv("WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
 
     class Config:
         env_file = ".env"
@@ -1,6 +1,10 @@
 from datetime import datetime
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text
+from typing import List
+from sqlalchemy.orm import sessionmaker, declarative_base, relationship
+from sqlalchemy import (
+    create_engine, inspect, text, select, Column, Integer, String, Float, DateTime, Text, JSON,
+    Boolean, ForeignKey, Table,
+)
 
 from .config import settings
 
@@ -11,6 +15,51 @@ engine = create_engine(settings.db_url, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Many-to-many links; skill_id is indexed so "who has skill X" is a single index lookup + join
+candidate_skills = Table(
+    "candidate_skills",
+    Base.metadata,
+    Column("candidate_id", Integer, ForeignKey("candidates.id"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skills.id"), primary_key=True, index=True),
+)
+
+jd_skills = Table(
+    "jd_skills",
+    Base.metadata,
+    Column("jd_id", Integer, ForeignKey("job_descriptions.id"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skills.id"), primary_key=True, index=True),
+    Column("required", Boolean, default=True),
+)
+
+class Skill(Base):
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True)  # normalized: lower-cased, stripped
+
+class Candidate(Base):
+    __tablename__ = "candidates"
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), unique=True, index=True)  # sha256 of the structured resume JSON
+    name = Column(String, index=True)
+    resume_structured = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    skills = relationship("Skill", secondary=candidate_skills)
+
+class JobDescription(Base):
+    __tablename__ = "job_descriptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), unique=True, index=True)  # sha256 of the structured JD JSON
+    title = Column(String, index=True)
+    seniority_level = Column(String)
+    jd_structured = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    skills = relationship("Skill", secondary=jd_skills)
+
 class Assessment(Base):
     __tablename__ = "assessments"
 
@@ -23,6 +72,42 @@ class Assessment(Base):
     seniority_score = Column(Float)
     raw_assessment = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Component inputs, so scores can be replayed without calling the LLM again
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), index=True)
+    jd_id = Column(Integer, ForeignKey("job_descriptions.id"), index=True)
+    relevant_years = Column(Float)
+    scoring_profile = Column(String)
+
+    candidate = relationship("Candidate")
+    job_description = relationship("JobDescription")
+
+def _add_missing_columns(bind):
+    """create_all() never alters existing tables; add new nullable columns to older databases."""
+    insp = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not insp.has_table(table.name):
+            continue
+        existing = {c["name"] for c in insp.get_columns(table.name)}
+        missing = [c for c in table.columns if c.name not in existing]
+        if not missing:
+            continue
+        with bind.begin() as conn:
+            for col in missing:
+                conn.execute(text(
+                    f"ALTER TABLE {table.name} ADD COLUMN {col.name} {col.type.compile(bind.dialect)}"
+                ))
+
+def candidates_with_skill(session, skill: str) -> List[Candidate]:
+    """All stored candidates listing the given skill (case-insensitive)."""
+    stmt = (
+        select(Candidate)
+        .join(candidate_skills, candidate_skills.c.candidate_id == Candidate.id)
+        .join(Skill, Skill.id == candidate_skills.c.skill_id)
+        .where(Skill.name == skill.lower().strip())
+    )
+    return list(session.execute(stmt).scalars())
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+def init_db(bind=None):
+    bind = bind if bind is not None else engine
+    Base.metadata.create_all(bind=bind)
+    _add_missing_columns(bind)
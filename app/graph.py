@@ -1,5 +1,3 @@
-from langgraph.graph import StateGraph, END
-
 from .models import AgentState
 from .agents import (
     resume_parser_agent,
@@ -21,8 +19,9 @@ def node_parse(state: AgentState) -> AgentState:
 
 def node_score(state: AgentState) -> AgentState:
     """Delegates scoring to ScoringAgent."""
-    scores = scoring_agent.run(state["resume_structured"], state["jd_structured"])
+    scores, score_inputs = scoring_agent.run(state["resume_structured"], state["jd_structured"])
     state["scores"] = scores
+    state["score_inputs"] = score_inputs
     return state
 
 
@@ -44,12 +43,15 @@ def node_guardrail_and_save(state: AgentState) -> AgentState:
         state["jd_structured"],
         state["scores"],
         state.get("assessment_text", ""),
+        state.get("score_inputs"),
     )
     state["cleaned_assessment_text"] = cleaned
     return state
 
 
 def build_graph():
+    from langgraph.graph import StateGraph, END
+
     workflow = StateGraph(AgentState)
 
     workflow.add_node("parse", node_parse)
@@ -64,3 +66,14 @@ def build_graph():
     workflow.add_edge("guardrail_and_save", END)
 
     return workflow.compile()
+
+
+_graph_app = None
+
+
+def get_graph():
+    """Compiled workflow shared by the API and UI; built on first call."""
+    global _graph_app
+    if _graph_app is None:
+        _graph_app = build_graph()
+    return _graph_app
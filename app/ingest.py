@@ -0,0 +1,104 @@
+import os
+import zipfile
+from typing import BinaryIO, Optional
+
+from starlette.exceptions import HTTPException
+
+from .config import settings
+
+# Leading bytes of the formats we can parse; anything else is treated as plain text
+_MAGIC = (
+    (b"%PDF-", "pdf"),
+    (b"PK\x03\x04", "zip"),  # DOCX, but also XLSX/ODT/plain ZIP; see sniff_stream
+    (b"\x89PNG\r\n\x1a\n", "image"),
+    (b"\xff\xd8\xff", "image"),  # JPEG
+)
+_EXTENSIONS = {
+    ".pdf": "pdf",
+    ".docx": "docx",
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+}
+SNIFF_BYTES = 8
+# Room for the multipart framing and the jd_text field on top of the resume itself
+FORM_OVERHEAD_BYTES = 1024 * 1024
+
+
+def sniff_file_type(head: bytes, filename: Optional[str] = None) -> str:
+    """Returns "pdf", "zip", "image", "docx" or "text" from magic bytes, using the extension only as a fallback."""
+    for magic, kind in _MAGIC:
+        if head.startswith(magic):
+            return kind
+    ext = os.path.splitext((filename or "").lower())[1]
+    return _EXTENSIONS.get(ext, "text")
+
+
+def _is_docx(fh: BinaryIO) -> bool:
+    try:
+        return "word/document.xml" in zipfile.ZipFile(fh).namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def sniff_stream(fh: BinaryIO, filename: Optional[str] = None) -> str:
+    """Like sniff_file_type for a seekable binary file; ZIPs are only "docx" if they contain word/document.xml."""
+    fh.seek(0)
+    kind = sniff_file_type(fh.read(SNIFF_BYTES), filename)
+    if kind == "zip":
+        fh.seek(0)
+        kind = "docx" if _is_docx(fh) else "zip"
+    fh.seek(0)
+    return kind
+
+
+def sniff_path(path: str, filename: Optional[str] = None) -> str:
+    with open(path, "rb") as fh:
+        return sniff_stream(fh, filename)
+
+
+class MaxBodySizeMiddleware:
+    """Rejects request bodies over a limit before the multipart form is parsed.
+
+    A declared Content-Length over the limit is refused without reading the
+    body; otherwise the received bytes are counted as Starlette streams them
+    into its upload spool, and the request fails with 413 once it crosses the
+    limit, so an oversized upload is never fully received.
+    """
+
+    def __init__(self, app, max_bytes: Optional[int] = None) -> None:
+        self.app = app
+        self.max_bytes = max_bytes or settings.max_upload_bytes + FORM_OVERHEAD_BYTES
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        declared = headers.get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+            await self._reject(send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=413, detail=f"Request body exceeds {self.max_bytes} bytes")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    async def _reject(self, send) -> None:
+        body = f'{{"detail":"Request body exceeds {self.max_bytes} bytes"}}'.encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,12 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
+from .config import settings
 from .models import AssessmentResponse
-from .graph import build_graph
-from .tools import parse_resume_text
+from .graph import get_graph
+from .rag import rag_retriever
+from .ingest import MaxBodySizeMiddleware
+from .tools import parse_resume_stream, preload_dependencies
 from .db import init_db
 
-app = FastAPI(title="RESUME ASSESSMENT AGENT")
+
+def warm_up() -> None:
+    """Loads parser/LLM dependencies and builds the RAG index off the request path."""
+    preload_dependencies()
+    rag_retriever.build_index()
+
+
+async def _run_warm_up(app: FastAPI) -> None:
+    try:
+        await asyncio.to_thread(warm_up)
+    except Exception as e:
+        print(f"Warm-up error: {e}")
+    finally:
+        app.state.ready = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build graph and init DB once per worker, after import rather than during it
+    init_db()
+    get_graph()
+
+    app.state.ready = not settings.warmup_on_startup
+    warm_up_task = None
+    if settings.warmup_on_startup:
+        warm_up_task = asyncio.create_task(_run_warm_up(app))
+    try:
+        yield
+    finally:
+        if warm_up_task is not None and not warm_up_task.done():
+            warm_up_task.cancel()
+
+
+app = FastAPI(title="RESUME ASSESSMENT AGENT", lifespan=lifespan)
 
 # CORS optional
 app.add_middleware(
@@ -16,26 +55,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-graph_app = build_graph()
-init_db()
+# Enforce the upload limit while the body streams in, before the multipart form is parsed
+app.add_middleware(MaxBodySizeMiddleware)
 
 @app.post("/assess_resume", response_model=AssessmentResponse)
 async def assess_resume(
     resume_file: UploadFile = File(...),
     jd_text: str = Form(...)
 ):
-    file_bytes = await resume_file.read()
-    if not file_bytes:
+    # MaxBodySizeMiddleware already bounded the body; Starlette spooled the file to disk
+    # past 1 MB, so parse straight from that spool rather than reading it into memory.
+    size = resume_file.size
+    if size is None:
+        size = resume_file.file.seek(0, 2)
+    if not size:
         raise HTTPException(status_code=400, detail="Empty resume file")
+    if size > settings.max_upload_bytes:
+        raise HTTPException(status_code=413, detail=f"Resume file exceeds {settings.max_upload_bytes} bytes")
 
-    resume_text = parse_resume_text(file_bytes, resume_file.filename)
+    resume_text = await asyncio.to_thread(parse_resume_stream, resume_file.file, resume_file.filename)
 
     state = {
         "resume_text": resume_text,
         "jd_text": jd_text,
     }
 
-    final_state = graph_app.invoke(state)
+    # Run the blocking pipeline off the event loop; LLM_CONCURRENCY caps concurrent OpenAI calls
+    final_state = await asyncio.to_thread(get_graph().invoke, state)
 
     scores = final_state.get("scores", {})
     cleaned_assessment = final_state.get("cleaned_assessment_text", "")
@@ -55,4 +101,11 @@ async def assess_resume(
 
 @app.get("/")
 def root():
-    return {"message": "Resume assessment agent is running."}
\ No newline at end of file
+    return {"message": "Resume assessment agent is running."}
+
+@app.get("/ready")
+def ready():
+    is_ready = getattr(app.state, "ready", False)
+    if not is_ready:
+        raise HTTPException(status_code=503, detail="Warm-up in progress")
+    return {"ready": True, "rag_index": rag_retriever.ready}
\ No newline at end of file
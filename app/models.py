@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
@@ -13,6 +13,15 @@ class AssessmentResponse(BaseModel):
     seniority_score: float
     assessment_text: str
 
+class ScoringProfile(BaseModel):
+    """Weights used to combine component scores into overall_score."""
+    name: str = "default"
+    match_titles: List[str] = []  # case-insensitive substrings of the JD title (role family or exact JD)
+    skills_weight: float = 0.5
+    experience_weight: float = 0.3
+    seniority_weight: float = 0.2
+    experience_cap_years: float = 5.0  # years of relevant experience that earn a full experience_score
+
 # LangGraph state
 class AgentState(TypedDict, total=False):
     resume_text: str
@@ -20,6 +29,7 @@ class AgentState(TypedDict, total=False):
     resume_structured: Dict[str, Any]
     jd_structured: Dict[str, Any]
     scores: Dict[str, float]
+    score_inputs: Dict[str, Any]  # relevant_years, scoring_profile; persisted, not shown as scores
     guidelines: str
     assessment_text: str
     cleaned_assessment_text: str
@@ -0,0 +1,129 @@
+import re
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, List, Optional
+
+# One compiled alternation scans the text once; named groups identify the entity type.
+# Order matters: more specific patterns (LinkedIn) come before the generic ones (URL).
+# Every entity starts at a token boundary, so a single shared lookbehind (see PII_RE)
+# rejects mid-word positions before any alternative is tried.
+_PATTERNS = (
+    ("EMAIL", r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
+    ("LINKEDIN", r"(?:https?://)?(?:www\.|[a-z]{2}\.)?linkedin\.com/(?:in|pub|profile)/[\w\-%.]+/?"),
+    ("URL", r"(?:https?://|www\.)[^\s<>()\"']+[^\s<>()\"'.,;:!?]"),
+    (
+        "ADDRESS",
+        r"\d{1,6}\s+(?:[A-Z][a-zA-Z]*\.?\s+){1,4}"
+        r"(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Way|Place|Pl|Terrace|Parkway|Pkwy)\b"
+        r"(?:,?\s+(?:Apt|Suite|Unit|#)\.?\s*\w+)?",
+    ),
+    (
+        "PHONE",
+        r"(?:"
+        r"\+\d{8,14}"  # +4915112345678
+        r"|(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)[\s.-]?)?\d{2,5}(?:[\s.-]\d{2,5}){1,4}"  # +91 98765 43210
+        r"|\d{10}"
+        r")(?![\w])",
+    ),
+)
+
+PII_RE = re.compile(
+    r"(?<![\w.%+\-])(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in _PATTERNS) + ")"
+)
+
+PLACEHOLDERS = {name: f"[REDACTED_{name}]" for name, _ in _PATTERNS}
+
+# PHONE on its own, without the token-boundary lookbehind, for re-scanning rejected candidates
+_PHONE_RE = re.compile(dict(_PATTERNS)["PHONE"])
+
+_DIGIT_GROUP_RE = re.compile(r"\d+")
+_DATE_RE = re.compile(r"\d{4}[-./]\d{1,2}[-./]\d{1,2}|\d{1,2}[-./]\d{1,2}[-./]\d{4}")
+_DOTTED_QUAD_RE = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}")
+
+# Below this many texts a worker pool costs more than it saves
+_PARALLEL_THRESHOLD = 512
+
+
+def _is_year(group: str) -> bool:
+    return len(group) == 4 and 1900 <= int(group) <= 2099
+
+
+def _looks_like_phone(candidate: str) -> bool:
+    groups = _DIGIT_GROUP_RE.findall(candidate)
+    digits = sum(len(g) for g in groups)
+    if not 7 <= digits <= 15:
+        return False
+    # Runs of years ("2019 2020 2021", "2018 - 2022") and dates are not phone numbers
+    if all(_is_year(g) for g in groups):
+        return False
+    # A leading bare year ("2020 555 123 4567") belongs to the text before the number
+    if len(groups) > 1 and candidate[0].isdigit() and _is_year(groups[0]):
+        return False
+    # Thousands grouping ("12.000.000", "10 000 000"); a leading "+" or "(" marks a real number
+    if len(groups) > 1 and candidate[0].isdigit() and all(len(g) == 3 for g in groups[1:]):
+        return False
+    # IPv4 addresses ("192.168.100.200")
+    if _DOTTED_QUAD_RE.fullmatch(candidate) and all(int(g) <= 255 for g in groups):
+        return False
+    return not _DATE_RE.fullmatch(candidate.strip())
+
+
+def _rescan_phone(text: str, match: "re.Match[str]") -> Optional["re.Match[str]"]:
+    """A rejected PHONE candidate may still end in a real number ("2019 2020 555 123 4567"):
+    retry from each later digit group; the retry may extend past the original span."""
+    groups = _DIGIT_GROUP_RE.finditer(text, match.start(), match.end())
+    next(groups, None)
+    for group in groups:
+        candidate = _PHONE_RE.match(text, group.start())
+        if candidate is not None and _looks_like_phone(candidate.group()):
+            return candidate
+    return None
+
+
+def mask_pii(text: str) -> str:
+    """Replaces emails, LinkedIn profiles, URLs, street addresses and phone numbers with typed placeholders."""
+    if not text:
+        return ""
+
+    out = []
+    pos = 0
+    while True:
+        match = PII_RE.search(text, pos)
+        if match is None:
+            break
+        kind = match.lastgroup
+        if kind == "PHONE" and not _looks_like_phone(match.group()):
+            rescanned = _rescan_phone(text, match)
+            if rescanned is None:
+                out.append(text[pos:match.end()])
+                pos = match.end()
+                continue
+            match = rescanned
+        out.append(text[pos:match.start()])
+        out.append(PLACEHOLDERS[kind])
+        pos = match.end()
+    out.append(text[pos:])
+    return "".join(out)
+
+
+def mask_pii_batch(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """Masks many texts, fanning out to a process pool for large batches.
+
+    Regex matching holds the GIL, so processes (not threads) are used. Pass an
+    existing executor to reuse a pool across calls.
+    """
+    texts = list(texts)
+    if executor is not None:
+        return list(executor.map(mask_pii, texts, chunksize=chunksize))
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(texts) < _PARALLEL_THRESHOLD:
+        return [mask_pii(t) for t in texts]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(mask_pii, texts, chunksize=chunksize))
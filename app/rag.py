@@ -1,41 +1,71 @@
 import os
 import glob
-import faiss
-import numpy as np
-from typing import List
-from openai import OpenAI
+import json
+import threading
+from typing import List, TYPE_CHECKING
 
 from .config import settings
+from .cache import make_key
+from .clients import get_openai_client, llm_slot
 
+if TYPE_CHECKING:
+    import numpy as np
 
-try:
-    client = OpenAI(api_key=settings.openai_api_key)
-except Exception:
-    client = None
 
-def _embed(texts: List[str]) -> np.ndarray:
-    if not client or not settings.openai_api_key:
+def _embed(texts: List[str]) -> "np.ndarray":
+    import numpy as np
+
+    if not settings.openai_api_key:
         return np.zeros((len(texts), 1536), dtype="float32") # Return dummy embeddings if no API key (for testing without crashing)
         
     try:
         print("using embedding model")
-        resp = client.embeddings.create(
-            model=settings.embedding_model,
-            input=texts
-        )
+        client = get_openai_client()
+        with llm_slot():
+            resp = client.embeddings.create(
+                model=settings.embedding_model,
+                input=texts
+            )
         vectors = [d.embedding for d in resp.data]
         return np.array(vectors).astype("float32")
     except Exception as e:
         print(f"Embedding error: {e}")
         return np.zeros((len(texts), 1536), dtype="float32")
 
+def _read_index_mmap(path: str):
+    import faiss
+
+    # IO_FLAG_MMAP only maps inverted lists (IVF); flat indexes such as IndexFlatL2 are still
+    # copied into private memory with it. IO_FLAG_MMAP_IFC maps the IndexFlatCodes storage.
+    mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", None)
+    if mmap_flag is None:
+        mmap_flag = getattr(faiss, "IO_FLAG_MMAP", 0)
+    flags = mmap_flag | getattr(faiss, "IO_FLAG_READ_ONLY", 0)
+    try:
+        return faiss.read_index(path, flags)
+    except RuntimeError:
+        # Index types without mmap support in this faiss build are read into memory
+        return faiss.read_index(path)
+
 class RAGRetriever:
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", index_dir: str | None = None):
         self.data_dir = data_dir
+        self.index_dir = index_dir if index_dir is not None else settings.rag_index_dir
         self.index = None
         self.chunks: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.index is not None
 
     def build_index(self):
+        # Serialized so a background warm-up and a first request never embed twice
+        with self._lock:
+            if self.index is None:
+                self._build_index()
+
+    def _build_index(self):
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir, exist_ok=True)
             return
@@ -53,11 +83,56 @@ class RAGRetriever:
         if not texts:
             return
 
+        fingerprint = make_key(settings.embedding_model, texts)
+        if self._load_persisted(fingerprint):
+            return
+
         vecs = _embed(texts)
         if vecs.shape[0] > 0:
+            import faiss
+
             dim = vecs.shape[1]
             self.index = faiss.IndexFlatL2(dim)
             self.index.add(vecs)
+            if settings.openai_api_key and vecs.any():  # never persist dummy embeddings
+                self._persist(fingerprint)
+
+    # Persisted index: built once (e.g. by the launcher) and memory-mapped read-only by every
+    # worker, so the pages are shared through the OS page cache instead of copied per process.
+    def _index_paths(self):
+        return (
+            os.path.join(self.index_dir, "guidelines.faiss"),
+            os.path.join(self.index_dir, "guidelines.json"),
+        )
+
+    def _load_persisted(self, fingerprint: str) -> bool:
+        if not self.index_dir:
+            return False
+        index_path, meta_path = self._index_paths()
+        try:
+            with open(meta_path, "r", encoding="utf-8") as fh:
+                meta = json.load(fh)
+        except (OSError, ValueError):
+            return False
+        if meta.get("fingerprint") != fingerprint or not os.path.exists(index_path):
+            return False
+        self.index = _read_index_mmap(index_path)
+        return True
+
+    def _persist(self, fingerprint: str) -> None:
+        if not self.index_dir:
+            return
+        import faiss
+
+        os.makedirs(self.index_dir, exist_ok=True)
+        index_path, meta_path = self._index_paths()
+        tmp_suffix = f".{os.getpid()}.tmp"
+        # Write-then-rename so concurrently starting workers never read a partial file
+        faiss.write_index(self.index, index_path + tmp_suffix)
+        os.replace(index_path + tmp_suffix, index_path)
+        with open(meta_path + tmp_suffix, "w", encoding="utf-8") as fh:
+            json.dump({"fingerprint": fingerprint, "embedding_model": settings.embedding_model}, fh)
+        os.replace(meta_path + tmp_suffix, meta_path)
 
     def retrieve(self, query: str, k: int = 4) -> str:
         if self.index is None or not self.chunks:
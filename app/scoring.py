@@ -0,0 +1,216 @@
+import json
+import os
+import argparse
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from .config import settings
+from .models import ScoringProfile
+
+DEFAULT_PROFILE = ScoringProfile()
+
+
+@lru_cache(maxsize=8)
+def load_scoring_profiles(path: Optional[str] = None) -> List[ScoringProfile]:
+    """Loads scoring profiles from JSON; the first entry is always the default profile.
+
+    File format:
+        {"default": {...weights...}, "profiles": [{"name": "ml", "match_titles": ["machine learning"], ...}]}
+    """
+    path = path or settings.scoring_profiles_path
+    if not os.path.exists(path):
+        return [DEFAULT_PROFILE]
+
+    with open(path, "r", encoding="utf-8") as fh:
+        raw = json.load(fh)
+
+    default = ScoringProfile(**{**raw.get("default", {}), "name": "default", "match_titles": []})
+    return [default] + [ScoringProfile(**p) for p in raw.get("profiles", [])]
+
+
+def get_profile(name: str, profiles: Optional[List[ScoringProfile]] = None) -> ScoringProfile:
+    profiles = profiles or load_scoring_profiles()
+    for profile in profiles:
+        if profile.name == name:
+            return profile
+    raise KeyError(f"Unknown scoring profile: {name}")
+
+
+def _profile_index(jd_title: Optional[str], profiles: List[ScoringProfile]) -> int:
+    title = (jd_title or "").lower()
+    for i, profile in enumerate(profiles[1:], start=1):
+        if any(m.lower() in title for m in profile.match_titles):
+            return i
+    return 0
+
+
+def resolve_profile(jd_title: Optional[str], profiles: Optional[List[ScoringProfile]] = None) -> ScoringProfile:
+    """Picks the first profile whose match_titles occur in the JD title, else the default."""
+    profiles = profiles or load_scoring_profiles()
+    return profiles[_profile_index(jd_title, profiles)]
+
+
+def experience_score(relevant_years: float, profile: ScoringProfile = DEFAULT_PROFILE) -> float:
+    if profile.experience_cap_years <= 0:
+        return 1.0
+    return min(relevant_years / profile.experience_cap_years, 1.0)
+
+
+def round_scores(values):
+    """Rounds scores to 3 decimals. Both the per-request and the bulk path round here,
+    so a stored row rescored with unchanged weights reproduces its stored values exactly."""
+    import numpy as np
+
+    return np.round(np.asarray(values, dtype=np.float64), 3)
+
+
+def _weight_row(profile: ScoringProfile) -> List[float]:
+    return [profile.skills_weight, profile.experience_weight, profile.seniority_weight]
+
+
+def combine_scores(components, weights):
+    """Vectorized overall_score: components and weights are (n, 3) arrays (skills, experience, seniority).
+
+    Components should already be rounded (as stored). Missing component scores
+    (NULL in the DB) count as 0.
+    """
+    import numpy as np
+
+    components = np.nan_to_num(np.asarray(components, dtype=np.float64))
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), components.shape)
+    overall = components[:, 0] * weights[:, 0] + components[:, 1] * weights[:, 1] + components[:, 2] * weights[:, 2]
+    return round_scores(overall)
+
+
+def overall_score(skills: float, experience: float, seniority: float, profile: ScoringProfile = DEFAULT_PROFILE) -> float:
+    return float(combine_scores([[skills, experience, seniority]], _weight_row(profile))[0])
+
+
+def rescore_assessments(
+    profile: Optional[ScoringProfile] = None,
+    jd_title: Optional[str] = None,
+    chunk_size: int = 50_000,
+    bind=None,
+) -> Dict[str, int]:
+    """Recomputes overall_score (and records the applied scoring_profile) for stored assessments.
+
+    Rows are read in id-ordered chunks, rescored with NumPy and written back with a
+    single executemany per chunk; only rows whose score changes are updated. Without
+    an explicit profile, each row uses the profile resolved from its jd_title. Rows
+    that stored relevant_years also get experience_score recomputed with the profile cap.
+    """
+    import numpy as np
+    from sqlalchemy import select, bindparam
+
+    from .db import engine, init_db, Assessment
+
+    table = Assessment.__table__
+    bind = bind if bind is not None else engine
+    # Databases created before relevant_years/scoring_profile existed need those columns first
+    init_db(bind)
+    profiles = load_scoring_profiles()
+    weight_table = np.array([_weight_row(p) for p in profiles], dtype=np.float64)
+    cap_table = np.array([p.experience_cap_years for p in profiles], dtype=np.float64)
+    name_table = np.array([p.name for p in profiles], dtype=object)
+    title_index: Dict[Optional[str], int] = {}
+
+    update_stmt = (
+        table.update()
+        .where(table.c.id == bindparam("_id"))
+        .values(
+            experience_score=bindparam("_experience"),
+            overall_score=bindparam("_overall"),
+            scoring_profile=bindparam("_profile"),
+        )
+    )
+
+    last_id = 0
+    scanned = updated = 0
+    while True:
+        stmt = (
+            select(
+                table.c.id,
+                table.c.jd_title,
+                table.c.skills_score,
+                table.c.experience_score,
+                table.c.seniority_score,
+                table.c.overall_score,
+                table.c.relevant_years,
+                table.c.scoring_profile,
+            )
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(chunk_size)
+        )
+        if jd_title is not None:
+            stmt = stmt.where(table.c.jd_title == jd_title)
+
+        with bind.connect() as conn:
+            rows = conn.execute(stmt).all()
+        if not rows:
+            break
+
+        ids = np.array([r[0] for r in rows], dtype=np.int64)
+        components = np.array([r[2:5] for r in rows], dtype=np.float64)
+        current = np.array([r[5] for r in rows], dtype=np.float64)
+        years = np.array([r[6] for r in rows], dtype=np.float64)
+        current_profiles = np.array([r[7] for r in rows], dtype=object)
+
+        if profile is not None:
+            weights = np.array(_weight_row(profile), dtype=np.float64)
+            caps = np.full(len(rows), profile.experience_cap_years, dtype=np.float64)
+            applied = np.full(len(rows), profile.name, dtype=object)
+        else:
+            idx = np.empty(len(rows), dtype=np.intp)
+            for i, r in enumerate(rows):
+                title = r[1]
+                if title not in title_index:
+                    title_index[title] = _profile_index(title, profiles)
+                idx[i] = title_index[title]
+            weights = weight_table[idx]
+            caps = cap_table[idx]
+            applied = name_table[idx]
+
+        current_experience = components[:, 1].copy()
+        has_years = ~np.isnan(years)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            capped = np.where(caps > 0, np.minimum(years / caps, 1.0), 1.0)
+        components[:, 1] = np.where(has_years, round_scores(capped), current_experience)
+
+        overall = combine_scores(components, weights)
+        changed = (
+            np.isnan(current)
+            | (overall != current)
+            | (has_years & (components[:, 1] != current_experience))
+            | (applied != current_profiles)
+        )
+
+        params = [
+            {"_id": int(i), "_experience": None if np.isnan(e) else float(e), "_overall": float(s), "_profile": name}
+            for i, e, s, name in zip(ids[changed], components[changed, 1], overall[changed], applied[changed])
+        ]
+        if params:
+            with bind.begin() as conn:
+                conn.execute(update_stmt, params)
+
+        scanned += len(rows)
+        updated += len(params)
+        last_id = int(ids[-1])
+
+    return {"scanned": scanned, "updated": updated}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute overall_score for stored assessments.")
+    parser.add_argument("--profile", help="Apply this named profile to every row instead of resolving per JD title")
+    parser.add_argument("--jd-title", help="Only rescore assessments for this exact JD title")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    profile = get_profile(args.profile) if args.profile else None
+    result = rescore_assessments(profile=profile, jd_title=args.jd_title, chunk_size=args.chunk_size)
+    print(f"Rescored {result['scanned']} assessments, updated {result['updated']}.")
+
+
+if __name__ == "__main__":
+    main()
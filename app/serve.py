@@ -0,0 +1,58 @@
+"""Production launcher: runs app.main under N uvicorn worker processes.
+
+Shared state is prepared once in the parent before workers start:
+- the database schema is created,
+- the RAG guideline index is embedded and persisted to RAG_INDEX_DIR, which
+  each worker then memory-maps read-only instead of re-embedding,
+- the SQLite cache at CACHE_PATH is created; workers share it for extraction
+  and assessment results, so cache hits are global across processes.
+
+Usage:
+    python -m app.serve --workers 4 --llm-concurrency 8 --port 8000
+
+Knobs (flags override env):
+    WEB_CONCURRENCY   number of worker processes
+    LLM_CONCURRENCY   max in-flight OpenAI requests per worker
+"""
+import os
+import argparse
+
+from .config import settings
+from .clients import _llm_semaphore
+
+
+def prepare_shared_state() -> None:
+    from .db import init_db
+    from .cache import get_cache
+    from .rag import rag_retriever
+
+    init_db()
+    get_cache().stats()  # creates the cache file/table before workers race for it
+    rag_retriever.build_index()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the resume assessment API with multiple workers.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=settings.workers)
+    parser.add_argument("--llm-concurrency", type=int, default=settings.llm_concurrency)
+    args = parser.parse_args()
+
+    # Spawned workers are separate interpreters and read the knobs from the environment;
+    # with --workers 1 uvicorn runs the app in this process, so update the live settings too
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    os.environ["LLM_CONCURRENCY"] = str(args.llm_concurrency)
+    settings.workers = args.workers
+    settings.llm_concurrency = args.llm_concurrency
+    _llm_semaphore.cache_clear()
+
+    prepare_shared_state()
+
+    import uvicorn
+
+    uvicorn.run("app.main:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,70 @@
-import re
 import json
 from io import BytesIO
-from typing import Dict, Any
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Any, List, Tuple, Union
 
-from pypdf import PdfReader
-from docx import Document as DocxDocument
-from PIL import Image
-import pytesseract
-
-from openai import OpenAI
 from .config import settings
+from .cache import get_cache, make_key
+from .clients import get_openai_client, llm_slot
+from .ingest import sniff_stream, sniff_path
+from .pii import mask_pii  # noqa: F401  (re-exported for agents/tests)
 from .rag import rag_retriever
-from .db import SessionLocal, Assessment
+from .models import ScoringProfile
+from .scoring import (
+    resolve_profile,
+    round_scores,
+    experience_score as _experience_score,
+    overall_score as _overall_score,
+)
+from .db import SessionLocal, Assessment, Candidate, JobDescription, Skill, candidate_skills, jd_skills
 
-# Initialize client
-client = OpenAI(api_key=settings.openai_api_key)
+# Parser and LLM dependencies are imported on first use to keep worker startup fast.
 
 # Parsing
-def parse_pdf(file_bytes: bytes) -> str:
+# Parsers accept raw bytes, a file path or an open binary file. Paths are opened and handed
+# over as file handles: pypdf copies a *path* into memory, but seeks a handle on demand.
+FileSource = Union[bytes, str, BinaryIO]
+
+@contextmanager
+def _open_source(source: FileSource):
+    if isinstance(source, (bytes, bytearray)):
+        yield BytesIO(source)
+    elif isinstance(source, str):
+        with open(source, "rb") as fh:
+            yield fh
+    else:
+        source.seek(0)
+        yield source
+
+def parse_pdf(file_bytes: FileSource) -> str:
     try:
-        reader = PdfReader(BytesIO(file_bytes))
-        texts = [page.extract_text() or "" for page in reader.pages]
+        from pypdf import PdfReader
+
+        with _open_source(file_bytes) as fh:
+            reader = PdfReader(fh)
+            texts = [page.extract_text() or "" for page in reader.pages]
         return "\n".join(texts)
     except Exception as e:
         return f"Error parsing PDF: {e}"
 
-def parse_docx(file_bytes: bytes) -> str:
+def parse_docx(file_bytes: FileSource) -> str:
     try:
-        mem_file = BytesIO(file_bytes)
-        doc = DocxDocument(mem_file)
+        from docx import Document as DocxDocument
+
+        with _open_source(file_bytes) as fh:
+            doc = DocxDocument(fh)
         return "\n".join(p.text for p in doc.paragraphs)
     except Exception as e:
         return f"Error parsing DOCX: {e}"
 
-def parse_image(file_bytes: bytes) -> str:
+def parse_image(file_bytes: FileSource) -> str:
     try:
-        image = Image.open(BytesIO(file_bytes))
-        text = pytesseract.image_to_string(image)
+        from PIL import Image
+        import pytesseract
+
+        with _open_source(file_bytes) as fh:
+            image = Image.open(fh)
+            text = pytesseract.image_to_string(image)
         return text if text.strip() else "[OCR found no text]"
     except ImportError:
         return "[OCR skipped: pytesseract library not installed]"
@@ -45,16 +73,40 @@ def parse_image(file_bytes: bytes) -> str:
              return "[OCR skipped: Tesseract binary not found on system. Please install Tesseract-OCR.]"
         return f"[OCR Error: {e}]"
 
-def parse_resume_text(file_bytes: bytes, filename: str) -> str:
-    fname = filename.lower()
-    if fname.endswith(".pdf"):
-        return parse_pdf(file_bytes)
-    elif fname.endswith(".docx"):
-        return parse_docx(file_bytes)
-    elif fname.endswith((".png", ".jpg", ".jpeg")):
-        return parse_image(file_bytes)
+def _parse_by_type(kind: str, source: FileSource) -> str:
+    if kind == "pdf":
+        return parse_pdf(source)
+    elif kind == "docx":
+        return parse_docx(source)
+    elif kind == "image":
+        return parse_image(source)
+    elif kind == "zip":
+        return "[Unsupported file: ZIP archive is not a DOCX document]"
     else:
-        return file_bytes.decode("utf-8", errors="ignore") # treat as plain text
+        with _open_source(source) as fh:
+            return fh.read().decode("utf-8", errors="ignore") # treat as plain text
+
+def parse_resume_text(file_bytes: bytes, filename: str) -> str:
+    return _parse_by_type(sniff_stream(BytesIO(file_bytes), filename), file_bytes)
+
+def parse_resume_file(path: str, filename: str | None = None) -> str:
+    """Parses a resume on disk; the type comes from magic bytes, with filename as fallback."""
+    return _parse_by_type(sniff_path(path, filename), path)
+
+def parse_resume_stream(fh: BinaryIO, filename: str | None = None) -> str:
+    """Parses a resume from a seekable binary file, e.g. an UploadFile's spooled temp file."""
+    return _parse_by_type(sniff_stream(fh, filename), fh)
+
+def preload_dependencies() -> None:
+    """Imports the heavy parser/LLM modules ahead of the first request (used by warm-up)."""
+    import pypdf  # noqa: F401
+    import docx  # noqa: F401
+    import PIL.Image  # noqa: F401
+    try:
+        import pytesseract  # noqa: F401
+    except ImportError:
+        pass
+    get_openai_client()
 
 # LLM helpers
 def llm_json_system_prompt() -> str:
@@ -65,21 +117,33 @@ def call_llm_json(prompt: str, system_prompt: str | None = None) -> Dict[str, An
         return {"error": "OpenAI API Key missing"}
 
     sys = system_prompt or llm_json_system_prompt()
+    # Shared across worker processes, so identical extractions hit the LLM once per host
+    cache = get_cache()
+    key = make_key("llm_json", "gpt-4o-mini", sys, prompt)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": sys},
-                {"role": "user", "content": prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+        with llm_slot():
+            resp = get_openai_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": sys},
+                    {"role": "user", "content": prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
         content = resp.choices[0].message.content
-        return json.loads(content)
+        result = json.loads(content)
     except Exception as e:
         print(f"LLM Error: {e}")
         return {}
 
+    if result:
+        cache.set(key, result)
+    return result
+
 # Extraction
 def extract_resume_structured(resume_text: str) -> Dict[str, Any]:
     prompt = f"""
@@ -129,7 +193,21 @@ def compute_scores(
     resume: Dict[str, Any],
     jd: Dict[str, Any],
     llm_json_fn=call_llm_json,
+    profile: ScoringProfile | None = None,
 ) -> Dict[str, float]:
+    scores, _ = compute_scores_with_inputs(resume, jd, llm_json_fn=llm_json_fn, profile=profile)
+    return scores
+
+def compute_scores_with_inputs(
+    resume: Dict[str, Any],
+    jd: Dict[str, Any],
+    llm_json_fn=call_llm_json,
+    profile: ScoringProfile | None = None,
+) -> Tuple[Dict[str, float], Dict[str, Any]]:
+    """Like compute_scores, but also returns the inputs behind them (relevant_years, profile name)
+    so they can be persisted and replayed; they are kept out of the 0.0-1.0 scores dict."""
+    profile = profile or resolve_profile(jd.get("title"))
+
     resume_skills = {str(s).lower().strip() for s in resume.get("skills", [])}
     jd_skills = {str(s).lower().strip() for s in jd.get("required_skills", []) if s}
 
@@ -153,15 +231,21 @@ def compute_scores(
     relevant_years = float(extra.get("relevant_years", 0.0) or 0.0)
     seniority_fit = float(extra.get("seniority_fit", 0.5) or 0.5)
 
-    experience_score = min(relevant_years / 5.0, 1.0)  # Assume 5 years is max score
-    overall = 0.5 * skills_score + 0.3 * experience_score + 0.2 * seniority_fit
+    experience_score = _experience_score(relevant_years, profile)  # capped at profile.experience_cap_years
+    # overall is built from the rounded components, exactly as bulk rescoring does from stored rows
+    skills_score, experience_score, seniority_fit = (
+        float(v) for v in round_scores([skills_score, experience_score, seniority_fit])
+    )
+    overall = _overall_score(skills_score, experience_score, seniority_fit, profile)
 
-    return {
-        "skills_score": round(skills_score, 3),
-        "experience_score": round(experience_score, 3),
-        "seniority_score": round(seniority_fit, 3),
-        "overall_score": round(overall, 3),
+    scores = {
+        "skills_score": skills_score,
+        "experience_score": experience_score,
+        "seniority_score": seniority_fit,
+        "overall_score": overall,
     }
+    inputs = {"relevant_years": round(relevant_years, 3), "scoring_profile": profile.name}
+    return scores, inputs
 
 # Assessment with RAG
 def generate_assessment(resume: Dict[str, Any], jd: Dict[str, Any], scores: Dict[str, float]) -> str:
@@ -214,33 +298,144 @@ def generate_assessment(resume: Dict[str, Any], jd: Dict[str, Any], scores: Dict
     if not settings.openai_api_key:
         return "Assessment could not be generated (No API Key)."
 
-    resp = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": "You are a fair, objective resume reviewer."},
-            {"role": "user", "content": user_prompt},
-        ],
-    )
-    return resp.choices[0].message.content
-
+    cache = get_cache()
+    key = make_key("assessment", "gpt-4o-mini", user_prompt)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
 
-# PII masking 
-EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-PHONE_RE = re.compile(r"\+?\d[\d\s\-]{7,}")
+    with llm_slot():
+        resp = get_openai_client().chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are a fair, objective resume reviewer."},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+    content = resp.choices[0].message.content
+    if content:
+        cache.set(key, content)
+    return content
 
-def mask_pii(text: str) -> str:
-    if not text: return ""
-    text = EMAIL_RE.sub("[REDACTED_EMAIL]", text)
-    text = PHONE_RE.sub("[REDACTED_PHONE]", text)
-    return text
 
 # DB helpers
-def save_assessment_to_db(resume: Dict[str, Any], jd: Dict[str, Any], scores: Dict[str, float], assessment_text: str):
+def content_hash(data: Dict[str, Any]) -> str:
+    """Stable sha256 of structured JSON, used to deduplicate candidates and JDs."""
+    return make_key(data)
+
+def _normalize_skills(skills) -> List[str]:
+    names = (str(s).lower().strip() for s in (skills or []) if s)
+    return list(dict.fromkeys(n for n in names if n))
+
+def _insert_ignore(session, table, rows: List[Dict[str, Any]], conflict_cols: List[str]) -> None:
+    """Inserts rows, skipping any that already exist under a unique constraint.
+
+    Workers saving the same resume/JD or a new shared skill concurrently would
+    otherwise race between the lookup and the insert and fail the whole save.
+    """
+    if not rows:
+        return
+    dialect = session.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        session.execute(insert(table).on_conflict_do_nothing(index_elements=conflict_cols), rows)
+        return
+
+    from sqlalchemy.exc import IntegrityError
+
+    for row in rows:
+        try:
+            with session.begin_nested():
+                session.execute(table.insert(), row)
+        except IntegrityError:
+            pass
+
+def _select_id(session, model, **filters) -> int | None:
+    return session.query(model.id).filter_by(**filters).scalar()
+
+def _get_or_create_skills(session, names: List[str]) -> Dict[str, int]:
+    """Returns {normalized skill name: skill id}, creating missing skills."""
+    if not names:
+        return {}
+    _insert_ignore(session, Skill.__table__, [{"name": n} for n in names], ["name"])
+    return dict(session.query(Skill.name, Skill.id).filter(Skill.name.in_(names)).all())
+
+def _get_or_create_candidate(session, resume: Dict[str, Any]) -> int:
+    digest = content_hash(resume)
+    candidate_id = _select_id(session, Candidate, content_hash=digest)
+    if candidate_id is not None:
+        return candidate_id
+
+    _insert_ignore(
+        session,
+        Candidate.__table__,
+        [{
+            "content_hash": digest,
+            "name": str(resume.get("name") or "Unknown"),
+            "resume_structured": resume,
+        }],
+        ["content_hash"],
+    )
+    candidate_id = _select_id(session, Candidate, content_hash=digest)
+
+    skills = _get_or_create_skills(session, _normalize_skills(resume.get("skills")))
+    _insert_ignore(
+        session,
+        candidate_skills,
+        [{"candidate_id": candidate_id, "skill_id": skill_id} for skill_id in skills.values()],
+        ["candidate_id", "skill_id"],
+    )
+    return candidate_id
+
+def _get_or_create_jd(session, jd: Dict[str, Any]) -> int:
+    digest = content_hash(jd)
+    jd_id = _select_id(session, JobDescription, content_hash=digest)
+    if jd_id is not None:
+        return jd_id
+
+    _insert_ignore(
+        session,
+        JobDescription.__table__,
+        [{
+            "content_hash": digest,
+            "title": str(jd.get("title") or "Unknown"),
+            "seniority_level": jd.get("seniority_level"),
+            "jd_structured": jd,
+        }],
+        ["content_hash"],
+    )
+    jd_id = _select_id(session, JobDescription, content_hash=digest)
+
+    required = _normalize_skills(jd.get("required_skills"))
+    preferred = [s for s in _normalize_skills(jd.get("preferred_skills")) if s not in required]
+    skills = _get_or_create_skills(session, required + preferred)
+    _insert_ignore(
+        session,
+        jd_skills,
+        [{"jd_id": jd_id, "skill_id": skills[n], "required": n in required} for n in required + preferred],
+        ["jd_id", "skill_id"],
+    )
+    return jd_id
+
+def save_assessment_to_db(
+    resume: Dict[str, Any],
+    jd: Dict[str, Any],
+    scores: Dict[str, float],
+    assessment_text: str,
+    score_inputs: Dict[str, Any] | None = None,
+):
+    score_inputs = score_inputs or {}
     session = SessionLocal()
     try:
         candidate_name = resume.get("name") or "Unknown"
         jd_title = jd.get("title") or "Unknown"
 
+        candidate_id = _get_or_create_candidate(session, resume)
+        jd_id = _get_or_create_jd(session, jd)
+
         record = Assessment(
             candidate_name=str(candidate_name),
             jd_title=str(jd_title),
@@ -249,6 +444,10 @@ def save_assessment_to_db(resume: Dict[str, Any], jd: Dict[str, Any], scores: Di
             experience_score=scores.get("experience_score", 0.0),
             seniority_score=scores.get("seniority_score", 0.0),
             raw_assessment=assessment_text,
+            candidate_id=candidate_id,
+            jd_id=jd_id,
+            relevant_years=score_inputs.get("relevant_years"),
+            scoring_profile=score_inputs.get("scoring_profile") or resolve_profile(jd.get("title")).name,
         )
         session.add(record)
         session.commit()
@@ -256,4 +455,22 @@ def save_assessment_to_db(resume: Dict[str, Any], jd: Dict[str, Any], scores: Di
         print(f"DB Error: {e}")
         session.rollback()
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+def replay_scores(assessment_id: int, profile: ScoringProfile | None = None) -> Dict[str, float]:
+    """Recomputes an assessment's scores from its stored structured JSON and inputs, without LLM calls."""
+    session = SessionLocal()
+    try:
+        record = session.get(Assessment, assessment_id)
+        if record is None or record.candidate is None or record.job_description is None:
+            raise ValueError(f"Assessment {assessment_id} has no stored structured inputs")
+
+        stored = {"relevant_years": record.relevant_years or 0.0, "seniority_fit": record.seniority_score}
+        return compute_scores(
+            record.candidate.resume_structured,
+            record.job_description.jd_structured,
+            llm_json_fn=lambda _prompt: stored,
+            profile=profile,
+        )
+    finally:
+        session.close()
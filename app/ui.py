@@ -1,14 +1,11 @@
 import os
 import gradio as gr
 
-from .tools import parse_resume_text
-from .graph import build_graph
+from .config import settings
+from .tools import parse_resume_file
+from .graph import get_graph
 from .db import init_db
 
-# Build graph and init DB once
-graph_app = build_graph()
-init_db()
-
 def assess_with_ui(resume_file, jd_text: str):
     if resume_file is None:
         return "Please upload a resume file.", {}
@@ -17,15 +14,17 @@ def assess_with_ui(resume_file, jd_text: str):
 
     try:
         filename = os.path.basename(resume_file)
-        with open(resume_file, "rb") as f:
-            file_bytes = f.read()
+        size = os.path.getsize(resume_file)
     except Exception as e:
         return f"Error reading file: {str(e)}", {}
 
-    if not file_bytes:
+    if not size:
         return "Empty resume file.", {}
+    if size > settings.max_upload_bytes:
+        return f"Resume file is too large (limit {settings.max_upload_bytes} bytes).", {}
 
-    resume_text = parse_resume_text(file_bytes, filename)
+    # Parse straight from Gradio's temp file instead of loading it into memory
+    resume_text = parse_resume_file(resume_file, filename)
 
     state = {
         "resume_text": resume_text,
@@ -33,7 +32,7 @@ def assess_with_ui(resume_file, jd_text: str):
     }
 
     # Run LangGraph pipeline
-    final_state = graph_app.invoke(state)
+    final_state = get_graph().invoke(state)
     scores = final_state.get("scores", {})
     assessment = final_state.get("cleaned_assessment_text", "")
 
@@ -46,6 +45,10 @@ def assess_with_ui(resume_file, jd_text: str):
     return assessment + disclaimer, scores
 
 def create_demo():
+    # Build graph and init DB once, when the demo is created rather than at import
+    init_db()
+    get_graph()
+
     with gr.Blocks(title="Resume Assessment Agent") as demo:
         gr.Markdown(
             """
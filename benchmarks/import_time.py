@@ -0,0 +1,80 @@
+"""Import-time benchmark for the API/UI entry points.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter,
+reports the slowest imports and fails if any heavy dependency is pulled in
+at import time or the total exceeds the budget.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module app.ui --budget-ms 2000 --top 25
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Dependencies that must only be loaded on first use (or by warm-up)
+HEAVY_MODULES = (
+    "faiss",
+    "numpy",
+    "pypdf",
+    "docx",
+    "PIL",
+    "pytesseract",
+    "openai",
+    "langgraph",
+)
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """Returns (module, self_us, cumulative_us) rows from ``-X importtime``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the total import time exceeds this")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    total_us = next((cum for name, _, cum in rows if name == args.module), 0)
+
+    print(f"{args.module}: {total_us / 1000:.1f} ms cumulative")
+    print(f"{'cumulative [ms]':>16}  {'self [ms]':>10}  module")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"{cum_us / 1000:>16.1f}  {self_us / 1000:>10.1f}  {name}")
+
+    loaded = {name.split(".")[0] for name, _, _ in rows}
+    heavy = sorted(m for m in HEAVY_MODULES if m in loaded)
+    failed = False
+    if heavy:
+        print(f"FAIL: heavy modules imported eagerly: {', '.join(heavy)}")
+        failed = True
+    if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+        print(f"FAIL: import time exceeds budget of {args.budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from app import tools
+from app.cache import SQLiteCache, make_key
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_sqlite_cache_roundtrip(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+    key = make_key("llm_json", "model", "prompt")
+
+    assert cache.get(key) is None
+    cache.set(key, {"skills": ["python"]})
+    assert cache.get(key) == {"skills": ["python"]}
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_sqlite_cache_reads_do_not_write(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), flush_every=3)
+    cache.set("k", 1)
+    conn = cache._conn()
+    before = conn.total_changes
+
+    cache.get("k")
+    cache.get("k")
+    assert conn.total_changes == before  # counted in memory only
+
+    cache.get("missing")  # third lookup flushes all counts in a single UPDATE
+    assert conn.total_changes == before + 1
+    assert cache.stats() == {"entries": 1, "hits": 2, "misses": 1}
+
+
+def test_sqlite_cache_stats_are_global(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    first, second = SQLiteCache(path), SQLiteCache(path)
+    first.set("k", 1)
+    first.get("k")
+    second.get("k")
+    first.flush_stats()
+
+    assert second.stats()["hits"] == 2
+
+
+def test_sqlite_cache_ttl_and_max_entries(tmp_path, monkeypatch):
+    from app import cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), ttl_seconds=60, max_entries=3, prune_every=1)
+
+    cache.set("old", 1)
+    now[0] += 61
+    assert cache.get("old") is None  # expired
+
+    for i in range(5):
+        now[0] += 1
+        cache.set(f"k{i}", i)
+
+    assert cache.stats()["entries"] == 3  # expired row and the two oldest pruned
+    assert [cache.get(f"k{i}") for i in range(5)] == [None, None, 2, 3, 4]
+
+
+def test_sqlite_cache_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    code = (
+        "import sys; from app.cache import SQLiteCache; "
+        "SQLiteCache(sys.argv[1]).set('k', {'from': 'child'})"
+    )
+    subprocess.run([sys.executable, "-c", code, path], cwd=PROJECT_ROOT, check=True)
+
+    cache = SQLiteCache(path)
+    assert cache.get("k") == {"from": "child"}
+
+
+def test_make_key_is_order_independent():
+    assert make_key({"a": 1, "b": 2}) == make_key({"b": 2, "a": 1})
+    assert make_key("a") != make_key("b")
+
+
+def test_call_llm_json_uses_shared_cache(tmp_path, monkeypatch):
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(content='{"relevant_years": 3}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(tools, "get_openai_client", lambda: fake_client)
+    monkeypatch.setattr(tools, "get_cache", lambda: SQLiteCache(str(tmp_path / "cache.sqlite")))
+    monkeypatch.setattr(tools.settings, "openai_api_key", "test-key")
+
+    assert tools.call_llm_json("same prompt") == {"relevant_years": 3}
+    assert tools.call_llm_json("same prompt") == {"relevant_years": 3}
+    assert len(calls) == 1
+
+
+def test_rag_index_is_persisted_and_reloaded(tmp_path, monkeypatch):
+    import numpy as np
+    from app import rag
+
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "guide.md").write_text("Prefer evidence over adjectives.", encoding="utf-8")
+
+    embeds = []
+
+    def fake_embed(texts):
+        embeds.append(texts)
+        return np.ones((len(texts), 4), dtype="float32")
+
+    monkeypatch.setattr(rag, "_embed", fake_embed)
+    monkeypatch.setattr(rag.settings, "openai_api_key", "test-key")
+
+    first = rag.RAGRetriever(data_dir=str(data_dir), index_dir=str(tmp_path / "index"))
+    first.build_index()
+    assert os.path.exists(tmp_path / "index" / "guidelines.faiss")
+
+    second = rag.RAGRetriever(data_dir=str(data_dir), index_dir=str(tmp_path / "index"))
+    second.build_index()
+
+    assert len(embeds) == 1  # the second worker reused the persisted index
+    assert second.index.ntotal == 1
+
+
+def test_persisted_rag_index_is_memory_mapped(tmp_path):
+    import pytest
+
+    if not os.path.exists("/proc/self/status"):
+        pytest.skip("needs /proc to read anonymous RSS")
+
+    import faiss
+    import numpy as np
+
+    index_path = str(tmp_path / "flat.faiss")
+    index = faiss.IndexFlatL2(512)
+    index.add(np.random.default_rng(0).random((20000, 512), dtype="float32"))  # ~40 MB of vectors
+    faiss.write_index(index, index_path)
+    del index
+
+    # Load in a fresh process (like a worker) and compare private, non-file-backed memory
+    code = """
+import sys
+import numpy as np
+from app.rag import _read_index_mmap
+
+def rss_anon_kb():
+    with open("/proc/self/status") as fh:
+        return next(int(line.split()[1]) for line in fh if line.startswith("RssAnon"))
+
+before = rss_anon_kb()
+index = _read_index_mmap(sys.argv[1])
+index.search(np.zeros((1, 512), dtype="float32"), 4)
+print(rss_anon_kb() - before)
+"""
+    proc = subprocess.run(
+        [sys.executable, "-c", code, index_path], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    grown_mb = int(proc.stdout.strip().splitlines()[-1]) / 1024
+    assert grown_mb < 10, f"index was copied into private memory ({grown_mb:.0f} MB)"
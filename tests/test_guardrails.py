@@ -1,4 +1,5 @@
 from app.tools import mask_pii
+from app.pii import mask_pii_batch
 
 
 def test_mask_pii_email_and_phone():
@@ -12,3 +13,44 @@ def test_mask_pii_email_and_phone():
 def test_mask_pii_empty():
     assert mask_pii("") == ""
     assert mask_pii(None) == ""  # type: ignore[arg-type]
+
+
+def test_mask_pii_urls_linkedin_and_address():
+    text = (
+        "Profile: https://www.linkedin.com/in/jane-doe-123/ and code at https://github.com/jane. "
+        "Lives at 221 Baker Street, Apt 4B, London."
+    )
+    out = mask_pii(text)
+    assert "[REDACTED_LINKEDIN]" in out
+    assert "[REDACTED_URL]" in out
+    assert "[REDACTED_ADDRESS], London." in out
+    assert "jane" not in out
+    assert "Baker" not in out
+
+
+def test_mask_pii_keeps_years_dates_and_metrics():
+    text = "Worked 2018 2019 2020 2021; 2018 - 2022; started 2020-01-15; 12.5% gain on 10000 samples."
+    assert mask_pii(text) == text
+    for text in (
+        "Managed a budget of 12.000.000 EUR",
+        "Scaled to 10 000 000 users",
+        "Served from 192.168.100.200 and 10.20.30.40",
+    ):
+        assert mask_pii(text) == text
+
+
+def test_mask_pii_phone_formats():
+    for phone in ("(555) 123-4567", "555.123.4567", "+4915112345678", "5551234567", "+91 98765 43210"):
+        assert mask_pii(f"Call {phone} today") == "Call [REDACTED_PHONE] today"
+
+
+def test_mask_pii_rescans_rejected_phone_candidates():
+    assert mask_pii("Years 2019 2020 555 123 4567") == "Years 2019 2020 [REDACTED_PHONE]"
+    assert mask_pii("2016 2017 2018 2019 2020 555 123 4567.") == "2016 2017 2018 2019 2020 [REDACTED_PHONE]."
+    assert mask_pii("2019-2020-2021 then 2022") == "2019-2020-2021 then 2022"
+
+
+def test_mask_pii_batch_matches_single():
+    texts = ["mail a@b.io", "", "nothing here", "call +1 555 123 4567"] * 200
+    assert mask_pii_batch(texts, workers=2) == [mask_pii(t) for t in texts]
+    assert mask_pii_batch(texts[:4], workers=1) == [mask_pii(t) for t in texts[:4]]
@@ -31,3 +31,144 @@ def test_parse_resume_text_plain():
     txt = b"hello world"
     result = tools.parse_resume_text(txt, "notes.txt")
     assert result == "hello world"
+
+
+def test_parse_resume_text_sniffs_magic_bytes(monkeypatch):
+    monkeypatch.setattr(tools, "parse_pdf", lambda source: "PDF TEXT")
+    result = tools.parse_resume_text(b"%PDF-1.7 ...", "resume.txt")
+    assert result == "PDF TEXT"
+
+
+def _zip_bytes(names) -> bytes:
+    import io
+    import zipfile
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name in names:
+            zf.writestr(name, "<xml/>")
+    return buf.getvalue()
+
+
+def test_parse_resume_file_from_path(tmp_path, monkeypatch):
+    seen = {}
+
+    def fake_parse_docx(source) -> str:
+        seen["source"] = source
+        return "DOCX TEXT"
+
+    monkeypatch.setattr(tools, "parse_docx", fake_parse_docx)
+    path = tmp_path / "upload.bin"
+    path.write_bytes(_zip_bytes(["[Content_Types].xml", "word/document.xml"]))
+
+    assert tools.parse_resume_file(str(path), "cv.pdf") == "DOCX TEXT"
+    assert seen["source"] == str(path)  # parsers get the path, not the bytes
+
+    text_path = tmp_path / "notes.txt"
+    text_path.write_bytes(b"hello world")
+    assert tools.parse_resume_file(str(text_path)) == "hello world"
+
+
+def test_non_docx_zip_is_not_routed_to_docx(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools, "parse_docx", lambda source: "DOCX TEXT")
+    path = tmp_path / "sheet.xlsx"
+    path.write_bytes(_zip_bytes(["[Content_Types].xml", "xl/workbook.xml"]))
+
+    assert tools.parse_resume_file(str(path), "resume.docx").startswith("[Unsupported file")
+
+
+def test_parse_pdf_reads_from_file_handle(tmp_path, monkeypatch):
+    import pypdf
+
+    seen = {}
+
+    class FakeReader:
+        def __init__(self, stream):
+            seen["stream"] = stream
+            self.pages = []
+
+    monkeypatch.setattr(pypdf, "PdfReader", FakeReader)
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(b"%PDF-1.7 ...")
+
+    tools.parse_resume_file(str(path))
+
+    # A handle lets pypdf seek objects on demand; a path would be copied into a BytesIO
+    assert hasattr(seen["stream"], "seek") and not isinstance(seen["stream"], (str, bytes))
+    assert getattr(seen["stream"], "name", None) == str(path)
+
+
+def _limited_app(max_bytes: int):
+    from fastapi import FastAPI, UploadFile, File
+    from app.ingest import MaxBodySizeMiddleware
+
+    app = FastAPI()
+    app.add_middleware(MaxBodySizeMiddleware, max_bytes=max_bytes)
+    calls = []
+
+    @app.post("/upload")
+    async def upload(resume_file: UploadFile = File(...)):
+        calls.append(resume_file.filename)
+        return {"ok": True}
+
+    return app, calls
+
+
+def test_body_limit_rejects_declared_content_length():
+    from fastapi.testclient import TestClient
+
+    app, calls = _limited_app(max_bytes=1024)
+    client = TestClient(app)
+
+    assert client.post("/upload", files={"resume_file": ("cv.txt", b"x" * 100)}).status_code == 200
+    assert client.post("/upload", files={"resume_file": ("cv.txt", b"x" * 4096)}).status_code == 413
+    assert calls == ["cv.txt"]
+
+
+def test_body_limit_enforced_while_streaming():
+    from fastapi.testclient import TestClient
+
+    app, calls = _limited_app(max_bytes=1024)
+    client = TestClient(app)
+    boundary = "b0undary"
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"resume_file\"; filename=\"cv.txt\"\r\n\r\n".encode()
+        + b"x" * 8192
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+    def chunks():  # no Content-Length: the body is sent chunked
+        for i in range(0, len(body), 512):
+            yield body[i:i + 512]
+
+    resp = client.post(
+        "/upload",
+        content=chunks(),
+        headers={"content-type": f"multipart/form-data; boundary={boundary}"},
+    )
+    assert resp.status_code == 413
+    assert calls == []
+
+
+def test_assess_resume_parses_upload_spool(monkeypatch):
+    from types import SimpleNamespace
+    from fastapi.testclient import TestClient
+    from app import main
+
+    seen = {}
+
+    def invoke(state):
+        seen["resume_text"] = state["resume_text"]
+        return {"scores": {"overall_score": 0.5}, "cleaned_assessment_text": "ok"}
+
+    monkeypatch.setattr(main, "init_db", lambda: None)
+    monkeypatch.setattr(main, "get_graph", lambda: SimpleNamespace(invoke=invoke))
+    monkeypatch.setattr(main.settings, "warmup_on_startup", False)
+
+    with TestClient(main.app) as client:
+        ok = client.post("/assess_resume", files={"resume_file": ("cv.txt", b"Python dev")}, data={"jd_text": "JD"})
+        empty = client.post("/assess_resume", files={"resume_file": ("cv.txt", b"")}, data={"jd_text": "JD"})
+
+    assert ok.status_code == 200
+    assert seen["resume_text"] == "Python dev"
+    assert empty.status_code == 400
@@ -21,3 +21,147 @@ def test_compute_scores_overlap_and_formula():
 
     expected_overall = 0.5 * (2 / 3) + 0.3 * 1.0 + 0.2 * 1.0
     assert scores["overall_score"] == pytest.approx(expected_overall, rel=1e-3)
+
+
+def test_compute_scores_with_profile():
+    from app.models import ScoringProfile
+
+    def fake_llm(prompt: str):
+        return {"relevant_years": 2.0, "seniority_fit": 0.5}
+
+    profile = ScoringProfile(
+        name="ml",
+        skills_weight=0.6,
+        experience_weight=0.2,
+        seniority_weight=0.2,
+        experience_cap_years=4.0,
+    )
+    resume = {"skills": ["Python"]}
+    jd = {"required_skills": ["Python", "PyTorch"]}
+
+    scores = compute_scores(resume, jd, llm_json_fn=fake_llm, profile=profile)
+
+    assert scores["experience_score"] == pytest.approx(0.5)  # 2 / 4 years cap
+    assert scores["overall_score"] == pytest.approx(0.6 * 0.5 + 0.2 * 0.5 + 0.2 * 0.5, rel=1e-3)
+
+
+def test_resolve_profile_by_jd_title():
+    from app.models import ScoringProfile
+    from app.scoring import resolve_profile
+
+    profiles = [
+        ScoringProfile(),
+        ScoringProfile(name="ml", match_titles=["machine learning", "ML Engineer"]),
+    ]
+    assert resolve_profile("Senior ML Engineer", profiles).name == "ml"
+    assert resolve_profile("Backend Developer", profiles).name == "default"
+    assert resolve_profile(None, profiles).name == "default"
+
+
+def test_combine_scores_vectorized_matches_scalar():
+    from app.models import ScoringProfile
+    from app.scoring import combine_scores, overall_score
+
+    profile = ScoringProfile()
+    components = [[2 / 3, 1.0, 1.0], [0.0, 0.4, float("nan")]]
+    out = combine_scores(components, [0.5, 0.3, 0.2])
+
+    assert out[0] == pytest.approx(overall_score(2 / 3, 1.0, 1.0, profile), abs=1e-3)
+    assert out[1] == pytest.approx(0.3 * 0.4)  # NULL component counts as 0
+
+
+def test_rescore_assessments_bulk(tmp_path):
+    from sqlalchemy import create_engine, select
+
+    from app.db import Base, Assessment
+    from app.models import ScoringProfile
+    from app.scoring import rescore_assessments
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'rescore.db'}")
+    Base.metadata.create_all(bind=engine)
+    table = Assessment.__table__
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(),
+            [
+                {"jd_title": "ML Engineer", "skills_score": 1.0, "experience_score": 0.0,
+                 "seniority_score": 0.0, "overall_score": 1.0, "scoring_profile": "skills_only"},
+                {"jd_title": "ML Engineer", "skills_score": 0.0, "experience_score": 1.0,
+                 "seniority_score": 0.0, "overall_score": 0.3, "scoring_profile": None},
+                {"jd_title": "Backend", "skills_score": 0.0, "experience_score": 0.0,
+                 "seniority_score": 1.0, "overall_score": 0.2, "scoring_profile": None},
+            ],
+        )
+
+    profile = ScoringProfile(name="skills_only", skills_weight=1.0, experience_weight=0.0, seniority_weight=0.0)
+    result = rescore_assessments(profile=profile, jd_title="ML Engineer", chunk_size=1, bind=engine)
+
+    assert result == {"scanned": 2, "updated": 1}
+    with engine.connect() as conn:
+        rows = conn.execute(select(table.c.overall_score, table.c.scoring_profile).order_by(table.c.id)).all()
+    assert [tuple(r) for r in rows] == [(1.0, "skills_only"), (0.0, "skills_only"), (0.2, None)]
+
+
+def test_rescore_with_unchanged_profile_is_idempotent(tmp_path):
+    import random
+    from sqlalchemy import create_engine
+
+    from app.db import Base, Assessment
+    from app.scoring import rescore_assessments
+
+    rng = random.Random(0)
+    rows = []
+    for _ in range(200):
+        fit = rng.random()
+        years = rng.uniform(0, 8)
+        n_jd = rng.randint(1, 7)
+        jd = {"required_skills": [f"s{i}" for i in range(n_jd)]}
+        resume = {"skills": [f"s{i}" for i in range(rng.randint(0, n_jd))]}
+        scores = compute_scores(resume, jd, llm_json_fn=lambda _p: {"relevant_years": years, "seniority_fit": fit})
+        rows.append({"jd_title": "Unknown", "scoring_profile": "default", **{k: scores[k] for k in
+                     ("skills_score", "experience_score", "seniority_score", "overall_score")}})
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'idempotent.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Assessment.__table__.insert(), rows)
+
+    assert rescore_assessments(bind=engine) == {"scanned": 200, "updated": 0}
+
+
+def test_compute_scores_keeps_inputs_out_of_scores():
+    from app.tools import compute_scores_with_inputs
+
+    def fake_llm(prompt: str):
+        return {"relevant_years": 7.5, "seniority_fit": 0.9}
+
+    scores, inputs = compute_scores_with_inputs({"skills": []}, {"required_skills": ["Go"]}, llm_json_fn=fake_llm)
+
+    assert set(scores) == {"skills_score", "experience_score", "seniority_score", "overall_score"}
+    assert all(0.0 <= v <= 1.0 for v in scores.values())
+    assert inputs == {"relevant_years": 7.5, "scoring_profile": "default"}
+
+
+def test_rescore_migrates_baseline_schema(tmp_path):
+    from sqlalchemy import create_engine, select, text
+
+    from app.db import Assessment
+    from app.scoring import rescore_assessments
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE assessments (id INTEGER PRIMARY KEY, candidate_name VARCHAR, jd_title VARCHAR, "
+            "overall_score FLOAT, skills_score FLOAT, experience_score FLOAT, seniority_score FLOAT, "
+            "raw_assessment TEXT, created_at DATETIME)"
+        ))
+        conn.execute(text(
+            "INSERT INTO assessments (jd_title, overall_score, skills_score, experience_score, seniority_score) "
+            "VALUES ('Backend', 0.5, 1.0, 0.0, 0.0)"
+        ))
+
+    assert rescore_assessments(bind=engine) == {"scanned": 1, "updated": 1}
+    table = Assessment.__table__
+    with engine.connect() as conn:
+        row = conn.execute(select(table.c.overall_score, table.c.scoring_profile)).one()
+    assert tuple(row) == (0.5, "default")
@@ -0,0 +1,32 @@
+import sys
+
+from app import serve
+from app.clients import _llm_semaphore
+
+
+def test_serve_applies_flags_in_process(monkeypatch):
+    launched = {}
+    semaphores = []
+
+    def fake_prepare():
+        semaphores.append(_llm_semaphore())  # e.g. embedding the RAG index takes an LLM slot
+
+    monkeypatch.setattr(serve, "prepare_shared_state", fake_prepare)
+    monkeypatch.setitem(sys.modules, "uvicorn", type(sys)("uvicorn"))
+    sys.modules["uvicorn"].run = lambda app, **kwargs: launched.update(kwargs)
+    monkeypatch.setattr(sys, "argv", ["serve", "--workers", "1", "--llm-concurrency", "2"])
+    monkeypatch.setattr(serve.settings, "llm_concurrency", serve.settings.llm_concurrency)
+    monkeypatch.setattr(serve.settings, "workers", serve.settings.workers)
+    monkeypatch.setenv("LLM_CONCURRENCY", "4")
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+
+    _llm_semaphore()  # built earlier with the old value
+    try:
+        serve.main()
+
+        assert launched["workers"] == 1
+        assert serve.settings.llm_concurrency == 2
+        assert serve.settings.workers == 1
+        assert semaphores[0]._initial_value == 2
+    finally:
+        _llm_semaphore.cache_clear()
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "benchmarks"))
+
+from import_time import HEAVY_MODULES, measure  # noqa: E402
+
+
+def _loaded_top_level_modules(module: str) -> set:
+    return {name.split(".")[0] for name, _, _ in measure(module)}
+
+
+def test_import_app_main_is_lazy():
+    loaded = _loaded_top_level_modules("app.main")
+    assert "app" in loaded
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_import_app_tools_is_lazy():
+    loaded = _loaded_top_level_modules("app.tools")
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_import_does_not_create_db(tmp_path):
+    # init_db() now runs in the FastAPI lifespan, not at import
+    code = "import app.main, os; print(os.path.exists('assessments.db'))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": PROJECT_ROOT},
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "False"
+
+
+def test_ready_endpoint_after_warm_up(monkeypatch):
+    import time
+    from fastapi.testclient import TestClient
+    from app import main
+
+    monkeypatch.setattr(main, "init_db", lambda: None)
+    monkeypatch.setattr(main, "get_graph", lambda: None)
+    monkeypatch.setattr(main, "warm_up", lambda: time.sleep(0.3))
+    monkeypatch.setattr(main.settings, "warmup_on_startup", True)
+
+    with TestClient(main.app) as client:
+        assert client.get("/ready").status_code == 503
+        for _ in range(200):
+            if client.get("/ready").status_code == 200:
+                break
+            time.sleep(0.01)
+        assert client.get("/ready").json()["ready"] is True
@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import tools
+from app.db import init_db, candidates_with_skill, Assessment, Candidate, JobDescription
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'storage.db'}")
+    init_db(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(tools, "SessionLocal", factory)
+    return factory
+
+
+RESUME = {"name": "Jane", "skills": ["Python", "PyTorch", "python "], "experience": []}
+JD = {"title": "ML Engineer", "required_skills": ["Python", "Docker"], "preferred_skills": ["PyTorch"]}
+SCORES = {
+    "skills_score": 0.5,
+    "experience_score": 0.6,
+    "seniority_score": 0.8,
+    "overall_score": 0.59,
+}
+SCORE_INPUTS = {"relevant_years": 3.0, "scoring_profile": "default"}
+
+
+def test_save_assessment_persists_structured_inputs(session_factory):
+    tools.save_assessment_to_db(RESUME, JD, SCORES, "text", SCORE_INPUTS)
+    tools.save_assessment_to_db(RESUME, JD, SCORES, "text again", SCORE_INPUTS)
+
+    session = session_factory()
+    try:
+        assert session.query(Assessment).count() == 2
+        assert session.query(Candidate).count() == 1  # deduplicated by content hash
+        assert session.query(JobDescription).count() == 1
+
+        record = session.query(Assessment).first()
+        assert record.relevant_years == 3.0
+        assert record.candidate.resume_structured == RESUME
+        assert {s.name for s in record.candidate.skills} == {"python", "pytorch"}
+        assert {s.name for s in record.job_description.skills} == {"python", "docker", "pytorch"}
+
+        assert [c.name for c in candidates_with_skill(session, "PyTorch")] == ["Jane"]
+        assert candidates_with_skill(session, "docker") == []
+    finally:
+        session.close()
+
+
+def test_replay_scores_without_llm(session_factory, monkeypatch):
+    def fail_llm(*args, **kwargs):
+        raise AssertionError("replay must not call the LLM")
+
+    monkeypatch.setattr(tools, "call_llm_json", fail_llm)
+    tools.save_assessment_to_db(RESUME, JD, SCORES, "text", SCORE_INPUTS)
+
+    scores = tools.replay_scores(1)
+
+    assert scores["skills_score"] == pytest.approx(0.5)  # python of python/docker
+    assert scores["experience_score"] == pytest.approx(0.6)  # 3 / 5 years
+    assert scores["seniority_score"] == pytest.approx(0.8)
+
+
+def test_content_hash_is_key_order_independent():
+    assert tools.content_hash({"a": 1, "b": [1, 2]}) == tools.content_hash({"b": [1, 2], "a": 1})
+
+
+def test_save_assessment_survives_concurrent_insert(session_factory, monkeypatch):
+    # Another worker stores the same resume and a shared skill between our lookup and insert
+    other = session_factory()
+    tools._get_or_create_candidate(other, RESUME)
+    other.commit()
+    other.close()
+
+    real_select_id = tools._select_id
+    missed = []
+
+    def racing_select_id(session, model, **filters):
+        if model is Candidate and not missed:
+            missed.append(True)
+            return None  # lookup ran before the other worker committed
+        return real_select_id(session, model, **filters)
+
+    monkeypatch.setattr(tools, "_select_id", racing_select_id)
+    tools.save_assessment_to_db(RESUME, JD, SCORES, "text", SCORE_INPUTS)
+
+    session = session_factory()
+    try:
+        assert missed
+        assert session.query(Assessment).count() == 1  # the assessment row was not dropped
+        assert session.query(Candidate).count() == 1
+        assert {s.name for s in session.query(Assessment).one().candidate.skills} == {"python", "pytorch"}
+    finally:
+        session.close()